@@ -2,10 +2,108 @@ import pandas as pd
 from rdflib import Graph, URIRef, Literal, Namespace
 from rdflib.namespace import RDF, RDFS, XSD, DCTERMS, FOAF
 import urllib.parse
-import re
 import hashlib
+from collections import Counter
 from datetime import datetime
+from multiprocessing import Pool
+import importlib.util
 import os
+import shutil
+
+# pandas Excel engine -> module it needs. Whether each is installed is checked
+# once with find_spec (nothing is imported), so excel_engine() only ever picks
+# a reader that can run. 'calamine' (pip install python-calamine) is a
+# Rust-backed reader for .xls/.xlsx/.ods, about twice as fast as the others.
+ENGINE_MODULES = {
+    'calamine': 'python_calamine',
+    'xlrd': 'xlrd',
+    'openpyxl': 'openpyxl',
+    'odf': 'odf',
+}
+INSTALLED_ENGINES = {engine for engine, module in ENGINE_MODULES.items()
+                     if importlib.util.find_spec(module) is not None}
+
+# Optional: Parquet cache of the parsed sheet (pip install pyarrow)
+HAVE_PARQUET = importlib.util.find_spec('pyarrow') is not None
+
+# Below this many rows per worker, starting processes costs more than it saves
+MIN_ROWS_PER_WORKER = 500
+
+# Column name used during conversion -> terms that identify it in the Excel header
+COLUMN_TERMS = [
+    ('SrcDatabase-来源库', ['SrcDatabase', '来源库']),
+    ('Title-题名', ['Title', '题名']),
+    ('Author-作者', ['Author', '作者']),
+    ('Organ-单位', ['Organ', '单位']),
+    ('Source-文献来源', ['Source', '文献来源']),
+    ('Keyword-关键词', ['Keyword', '关键词']),
+    ('Summary-摘要', ['Summary', '摘要']),
+    ('PubTime-发表时间', ['PubTime', '发表时间']),
+    ('URL-网址', ['URL', '网址']),
+]
+
+def is_used_column(col):
+    return any(term in str(col) for _, terms in COLUMN_TERMS for term in terms)
+
+# File signature -> engines that read it, in order of preference, so the
+# right reader is used on the first try
+EXCEL_SIGNATURES = [
+    (b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1', ['calamine', 'xlrd']),    # .xls (OLE2)
+    (b'PK\x03\x04', ['calamine', 'openpyxl']),                          # .xlsx (zip)
+]
+
+def excel_engine(file_path):
+    with open(file_path, 'rb') as f:
+        head = f.read(80)
+    for signature, engines in EXCEL_SIGNATURES:
+        if head.startswith(signature):
+            # .ods is a zip too; its first entry is the uncompressed mimetype
+            if b'opendocument' in head:
+                engines = ['calamine', 'odf']
+            return next((e for e in engines if e in INSTALLED_ENGINES), None)
+    return None  # Unknown (or no matching engine installed): let pandas pick
+
+def file_md5(file_path, digest=None):
+    # Read in 1 MiB chunks, so memory use doesn't grow with the file
+    digest = digest or hashlib.md5()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest
+
+def excel_cache_path(file_path):
+    # Keyed by file content and the column selection, so edits to either miss the cache
+    digest = file_md5(file_path, hashlib.md5(repr(COLUMN_TERMS).encode('utf-8')))
+    cache_dir = os.path.join(os.path.dirname(os.path.abspath(file_path)), '.cache')
+    return os.path.join(cache_dir, f"{digest.hexdigest()}.parquet")
+
+def read_cached_sheet(cache_path):
+    # A damaged cache file is deleted and treated as a miss, so it can't
+    # break every later run
+    try:
+        return pd.read_parquet(cache_path)
+    except Exception as e:
+        print(f"缓存文件无效，已删除: {cache_path} ({e})")
+        try:
+            os.remove(cache_path)
+        except OSError:
+            pass
+        return None
+
+def write_cached_sheet(df, cache_path):
+    # Written to a temporary file and renamed, so an interrupted write never
+    # leaves a truncated cache behind; failing to cache never stops the conversion
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        df.to_parquet(tmp_path)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        print(f"写入缓存失败: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
 
 class BUPTResearchRDF:
     def __init__(self):
@@ -13,6 +111,13 @@ class BUPTResearchRDF:
         self.setup_namespaces()
         self.paper_count = 0
         self.triple_count = 0
+        # process_paper collects triples here; convert() inserts them in one batch
+        self.pending_triples = []
+        # (kind, name) -> URI, so each author/org/journal/keyword is hashed only once
+        self.entity_uris = {}
+        # text -> Literal(text, lang='zh'): titles and names repeat across triples
+        # and papers, so each is shared (and freed with the converter)
+        self.literals = {}
         
     def setup_namespaces(self):
         self.BUPT = Namespace("http://bupt.edu.cn/research/")
@@ -32,169 +137,201 @@ class BUPTResearchRDF:
             return "unknown"
         return urllib.parse.quote(str(text).strip().replace(' ', '_'), safe='')
     
-    def extract_year(self, pub_time):
-        if pd.isna(pub_time):
-            return None
-        pub_str = str(pub_time)
-        match = re.search(r'\b(20\d{2}|19\d{2})\b', pub_str)
-        return match.group(1) if match else None
+    def entity_uri(self, kind, name):
+        uri = self.entity_uris.get((kind, name))
+        if uri is None:
+            entity_id = hashlib.md5(name.encode('utf-8')).hexdigest()[:8]
+            uri = self.entity_uris[(kind, name)] = self.BUPT[f"{kind}/{entity_id}"]
+        return uri
+    
+    def zh_literal(self, text):
+        literal = self.literals.get(text)
+        if literal is None:
+            literal = self.literals[text] = Literal(text, lang='zh')
+        return literal
+    
+    def normalize_columns(self, df):
+        # Clean text with whole-column pandas string operations, so process_paper
+        # only reads ready-made values
+        for col in ['SrcDatabase-来源库', 'Title-题名', 'Source-文献来源', 'Summary-摘要', 'URL-网址']:
+            if col in df.columns:
+                df[col] = df[col].astype('string').str.strip()
+        
+        for col in ['Author-作者', 'Organ-单位', 'Keyword-关键词']:
+            if col in df.columns:
+                df[col] = df[col].astype('string')
+        
+        if 'Summary-摘要' in df.columns:
+            summary = df['Summary-摘要']
+            too_long = (summary.str.len() > 1000).fillna(False)
+            df['Summary-摘要'] = summary.mask(too_long, summary.str.slice(0, 1000) + "...")
+        
+        if 'PubTime-发表时间' in df.columns:
+            df['PubYear-发表年份'] = (df['PubTime-发表时间'].astype('string')
+                                      .str.extract(r'\b(20\d{2}|19\d{2})\b', expand=False))
+        
+        return df
     
     def process_paper(self, idx, row):
         paper_id = f"paper_{idx+1:04d}"
         paper_uri = self.BUPT[paper_id]
+        add = self.pending_triples.append
+        get = row.get
         
         
         if (idx + 1) % 50 == 0:
             print(f"正在处理第 {idx + 1} 篇论文...")
         
         
-        self.g.add((paper_uri, RDF.type, self.SCHEMA.ScholarlyArticle))
+        add((paper_uri, RDF.type, self.SCHEMA.ScholarlyArticle))
         self.triple_count += 1
         
         
-        if 'SrcDatabase-来源库' in row and pd.notna(row['SrcDatabase-来源库']):
-            src_type = str(row['SrcDatabase-来源库']).strip()
-            self.g.add((paper_uri, DCTERMS.type, Literal(src_type, lang='zh')))
-            self.g.add((paper_uri, self.BUPT_ONTOLOGY.sourceDatabase, Literal(src_type, lang='zh')))
+        src_type = get('SrcDatabase-来源库')
+        if src_type:
+            add((paper_uri, DCTERMS.type, self.zh_literal(src_type)))
+            add((paper_uri, self.BUPT_ONTOLOGY.sourceDatabase, self.zh_literal(src_type)))
             self.triple_count += 2
         
         
-        if 'Title-题名' in row and pd.notna(row['Title-题名']):
-            title = str(row['Title-题名']).strip()
-            self.g.add((paper_uri, DCTERMS.title, Literal(title, lang='zh')))
-            self.g.add((paper_uri, self.SCHEMA.name, Literal(title, lang='zh')))
-            self.triple_count += 2
+        title = get('Title-题名')
+        if title:
+            add((paper_uri, DCTERMS.title, self.zh_literal(title)))
+            add((paper_uri, self.SCHEMA.name, self.zh_literal(title)))
+            add((paper_uri, self.BUPT_ONTOLOGY.nameLower, self.zh_literal(title.lower())))
+            self.triple_count += 3
         
         
-        if 'Author-作者' in row and pd.notna(row['Author-作者']):
-            authors = str(row['Author-作者']).split(';')
-            
+        author_text = get('Author-作者')
+        if author_text:
+            authors = author_text.split(';')
             
-            org_text = ""
-            if 'Organ-单位' in row and pd.notna(row['Organ-单位']):
-                org_text = str(row['Organ-单位'])
             
+            org_text = get('Organ-单位')
             org_list = org_text.split(';') if org_text else []
             
             for i, author_name in enumerate(authors):
                 author_name = author_name.strip()
                 if author_name:
-                    author_id = hashlib.md5(author_name.encode('utf-8')).hexdigest()[:8]
-                    author_uri = self.BUPT[f"author/{author_id}"]
+                    author_uri = self.entity_uri("author", author_name)
                     
                     
-                    self.g.add((author_uri, RDF.type, FOAF.Person))
-                    self.g.add((author_uri, FOAF.name, Literal(author_name, lang='zh')))
-                    self.g.add((author_uri, self.SCHEMA.name, Literal(author_name, lang='zh')))
+                    add((author_uri, RDF.type, FOAF.Person))
+                    add((author_uri, FOAF.name, self.zh_literal(author_name)))
+                    add((author_uri, self.SCHEMA.name, self.zh_literal(author_name)))
+                    add((author_uri, self.BUPT_ONTOLOGY.nameLower, self.zh_literal(author_name.lower())))
                     
                     
-                    self.g.add((paper_uri, DCTERMS.creator, author_uri))
-                    self.g.add((paper_uri, self.SCHEMA.author, author_uri))
+                    add((paper_uri, DCTERMS.creator, author_uri))
+                    add((paper_uri, self.SCHEMA.author, author_uri))
                     
                     
                     if i < len(org_list) and org_list[i].strip():
                         org_name = org_list[i].strip()
-                        org_id = hashlib.md5(org_name.encode('utf-8')).hexdigest()[:8]
-                        org_uri = self.BUPT[f"org/{org_id}"]
+                        org_uri = self.entity_uri("org", org_name)
                         
                         
-                        self.g.add((org_uri, RDF.type, self.SCHEMA.Organization))
-                        self.g.add((org_uri, self.SCHEMA.name, Literal(org_name, lang='zh')))
+                        add((org_uri, RDF.type, self.SCHEMA.Organization))
+                        add((org_uri, self.SCHEMA.name, self.zh_literal(org_name)))
+                        add((org_uri, self.BUPT_ONTOLOGY.nameLower, self.zh_literal(org_name.lower())))
                         
                         
-                        self.g.add((author_uri, self.SCHEMA.affiliation, org_uri))
-                        self.g.add((org_uri, self.SCHEMA.member, author_uri))
-                        self.triple_count += 5
+                        add((author_uri, self.SCHEMA.affiliation, org_uri))
+                        add((org_uri, self.SCHEMA.member, author_uri))
+                        self.triple_count += 6
                     
-                    self.triple_count += 5
+                    self.triple_count += 6
         
         
-        if 'Source-文献来源' in row and pd.notna(row['Source-文献来源']):
-            source = str(row['Source-文献来源']).strip()
-            journal_id = hashlib.md5(source.encode('utf-8')).hexdigest()[:8]
-            journal_uri = self.BUPT[f"journal/{journal_id}"]
+        source = get('Source-文献来源')
+        if source:
+            journal_uri = self.entity_uri("journal", source)
             
             
-            self.g.add((journal_uri, RDF.type, self.SCHEMA.Periodical))
-            self.g.add((journal_uri, RDF.type, self.SCHEMA.PublicationVolume))
-            self.g.add((journal_uri, self.SCHEMA.name, Literal(source, lang='zh')))
-            self.g.add((journal_uri, DCTERMS.title, Literal(source, lang='zh')))
+            add((journal_uri, RDF.type, self.SCHEMA.Periodical))
+            add((journal_uri, RDF.type, self.SCHEMA.PublicationVolume))
+            add((journal_uri, self.SCHEMA.name, self.zh_literal(source)))
+            add((journal_uri, DCTERMS.title, self.zh_literal(source)))
+            add((journal_uri, self.BUPT_ONTOLOGY.nameLower, self.zh_literal(source.lower())))
             
            
-            self.g.add((paper_uri, DCTERMS.source, journal_uri))
-            self.g.add((paper_uri, self.SCHEMA.isPartOf, journal_uri))
-            self.g.add((journal_uri, self.SCHEMA.hasPart, paper_uri))
-            self.triple_count += 8
+            add((paper_uri, DCTERMS.source, journal_uri))
+            add((paper_uri, self.SCHEMA.isPartOf, journal_uri))
+            add((journal_uri, self.SCHEMA.hasPart, paper_uri))
+            self.triple_count += 9
         
         
-        if 'Keyword-关键词' in row and pd.notna(row['Keyword-关键词']):
-            keywords = str(row['Keyword-关键词']).split(';')
+        keyword_text = get('Keyword-关键词')
+        if keyword_text:
+            keywords = keyword_text.split(';')
             for keyword in keywords:
                 keyword = keyword.strip()
                 if keyword:
-                    keyword_id = hashlib.md5(keyword.encode('utf-8')).hexdigest()[:8]
-                    keyword_uri = self.BUPT[f"keyword/{keyword_id}"]
+                    keyword_uri = self.entity_uri("keyword", keyword)
                     
                     
-                    self.g.add((keyword_uri, RDF.type, self.SCHEMA.DefinedTerm))
-                    self.g.add((keyword_uri, self.SCHEMA.name, Literal(keyword, lang='zh')))
-                    self.g.add((keyword_uri, self.SCHEMA.termCode, Literal(keyword, lang='zh')))
+                    add((keyword_uri, RDF.type, self.SCHEMA.DefinedTerm))
+                    add((keyword_uri, self.SCHEMA.name, self.zh_literal(keyword)))
+                    add((keyword_uri, self.SCHEMA.termCode, self.zh_literal(keyword)))
+                    add((keyword_uri, self.BUPT_ONTOLOGY.nameLower, self.zh_literal(keyword.lower())))
                     
                     
-                    self.g.add((paper_uri, self.SCHEMA.keywords, keyword_uri))
-                    self.g.add((paper_uri, self.SCHEMA.about, keyword_uri))
-                    self.g.add((keyword_uri, self.SCHEMA.isRelatedTo, paper_uri))
-                    self.triple_count += 6
+                    add((paper_uri, self.SCHEMA.keywords, keyword_uri))
+                    add((paper_uri, self.SCHEMA.about, keyword_uri))
+                    add((keyword_uri, self.SCHEMA.isRelatedTo, paper_uri))
+                    self.triple_count += 7
         
         
-        if 'Summary-摘要' in row and pd.notna(row['Summary-摘要']):
-            summary = str(row['Summary-摘要']).strip()
-            if len(summary) > 1000:
-                summary = summary[:1000] + "..."
-            self.g.add((paper_uri, DCTERMS.abstract, Literal(summary, lang='zh')))
-            self.g.add((paper_uri, self.SCHEMA.description, Literal(summary, lang='zh')))
+        summary = get('Summary-摘要')
+        if summary:
+            add((paper_uri, DCTERMS.abstract, self.zh_literal(summary)))
+            add((paper_uri, self.SCHEMA.description, self.zh_literal(summary)))
             self.triple_count += 2
         
         
-        if 'PubTime-发表时间' in row and pd.notna(row['PubTime-发表时间']):
-            pub_time = str(row['PubTime-发表时间'])
-            year = self.extract_year(pub_time)
-            if year:
-                self.g.add((paper_uri, DCTERMS.date, Literal(year, datatype=XSD.gYear)))
-                self.g.add((paper_uri, self.SCHEMA.datePublished, Literal(year, datatype=XSD.gYear)))
-                self.triple_count += 2
+        year = get('PubYear-发表年份')
+        if year:
+            add((paper_uri, DCTERMS.date, Literal(year, datatype=XSD.gYear)))
+            add((paper_uri, self.SCHEMA.datePublished, Literal(year, datatype=XSD.gYear)))
+            self.triple_count += 2
         
         
-        if 'URL-网址' in row and pd.notna(row['URL-网址']):
-            url = str(row['URL-网址']).strip()
+        url = get('URL-网址')
+        if url:
             if url.startswith('http'):
-                self.g.add((paper_uri, self.SCHEMA.url, Literal(url, datatype=XSD.anyURI)))
+                add((paper_uri, self.SCHEMA.url, Literal(url, datatype=XSD.anyURI)))
                 self.triple_count += 1
         
         self.paper_count += 1
         return paper_uri
     
-    def convert(self, file_path, output_dir="output"):
+    def convert(self, file_path, output_dir="output", workers=None):
         print("开始RDF转换...")
         
         os.makedirs(output_dir, exist_ok=True)
         
         print(f"读取文件: {file_path}")
         
+        # Only read the columns the conversion uses, all as text (no type inference)
+        # A Parquet copy of an unchanged file is read instead of parsing it again
         try:
             
-            df = pd.read_excel(file_path, engine='xlrd')
-            print(f"成功读取Excel文件，共 {len(df)} 行")
+            cache_path = excel_cache_path(file_path) if HAVE_PARQUET else None
+            df = None
+            if cache_path and os.path.exists(cache_path):
+                df = read_cached_sheet(cache_path)
+                if df is not None:
+                    print(f"从缓存读取: {cache_path}，共 {len(df)} 行")
+            if df is None:
+                engine = excel_engine(file_path)
+                df = pd.read_excel(file_path, engine=engine, usecols=is_used_column, dtype=str)
+                print(f"成功读取Excel文件 (引擎: {engine or '默认'})，共 {len(df)} 行")
+                if cache_path:
+                    write_cached_sheet(df, cache_path)
             
         except Exception as e:
             print(f"读取Excel失败: {e}")
-            
-            try:
-                df = pd.read_excel(file_path)
-                print(f"使用默认引擎成功读取，共 {len(df)} 行")
-            except Exception as e2:
-                print(f"所有引擎都失败: {e2}")
-                return None
+            return None
         
         print(f"发现记录: {len(df)} 条")
         
@@ -213,24 +350,10 @@ class BUPTResearchRDF:
         for col in df.columns:
             col_str = str(col)
             
-            if any(term in col_str for term in ['SrcDatabase', '来源库']):
-                column_mapping[col] = 'SrcDatabase-来源库'
-            elif any(term in col_str for term in ['Title', '题名']):
-                column_mapping[col] = 'Title-题名'
-            elif any(term in col_str for term in ['Author', '作者']):
-                column_mapping[col] = 'Author-作者'
-            elif any(term in col_str for term in ['Organ', '单位']):
-                column_mapping[col] = 'Organ-单位'
-            elif any(term in col_str for term in ['Source', '文献来源']):
-                column_mapping[col] = 'Source-文献来源'
-            elif any(term in col_str for term in ['Keyword', '关键词']):
-                column_mapping[col] = 'Keyword-关键词'
-            elif any(term in col_str for term in ['Summary', '摘要']):
-                column_mapping[col] = 'Summary-摘要'
-            elif any(term in col_str for term in ['PubTime', '发表时间']):
-                column_mapping[col] = 'PubTime-发表时间'
-            elif any(term in col_str for term in ['URL', '网址']):
-                column_mapping[col] = 'URL-网址'
+            for name, terms in COLUMN_TERMS:
+                if any(term in col_str for term in terms):
+                    column_mapping[col] = name
+                    break
         
         if column_mapping:
             print("\n重命名列:")
@@ -238,12 +361,38 @@ class BUPTResearchRDF:
                 print(f"  {old} -> {new}")
             df = df.rename(columns=column_mapping)
         
+        df = self.normalize_columns(df)
+        # Missing cells become '', so process_paper can test values with a plain `if`
+        df = df.fillna('')
+        
         print("\n转换为RDF三元组...")
-        for idx, row in df.iterrows():
-            self.process_paper(idx, row)
-            
-            if (idx + 1) % 50 == 0:
-                print(f"已处理 {idx + 1}/{len(df)} 条记录")
+        # Plain dicts instead of iterrows(), which builds a Series for every row
+        rows = list(zip(df.index, df.to_dict('records')))
+        
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(rows) // MIN_ROWS_PER_WORKER)
+        
+        if workers > 1:
+            # Papers are independent and entity URIs are content hashes, so
+            # chunks can be converted in parallel and merged afterwards
+            print(f"使用 {workers} 个进程并行转换")
+            chunk_size = -(-len(rows) // workers)
+            chunks = [rows[i:i + chunk_size] for i in range(0, len(rows), chunk_size)]
+            with Pool(workers) as pool:
+                for triples, paper_count, triple_count in pool.map(process_chunk, chunks):
+                    self.pending_triples.extend(triples)
+                    self.paper_count += paper_count
+                    self.triple_count += triple_count
+        else:
+            for idx, row in rows:
+                self.process_paper(idx, row)
+                
+                if (idx + 1) % 50 == 0:
+                    print(f"已处理 {idx + 1}/{len(df)} 条记录")
+        
+        self.g.addN((s, p, o, self.g) for s, p, o in self.pending_triples)
+        self.pending_triples = []
         
         
         complete_ttl = f"{output_dir}/complete_bupt_research.ttl"
@@ -269,15 +418,10 @@ class BUPTResearchRDF:
             f.write("\n关系类型统计:\n")
             
             
-            predicates = {}
-            for s, p, o in self.g:
-                pred_str = str(p)
-                if pred_str not in predicates:
-                    predicates[pred_str] = 0
-                predicates[pred_str] += 1
+            predicates = Counter(str(p) for p in self.g.predicates())
             
             
-            sorted_preds = sorted(predicates.items(), key=lambda x: x[1], reverse=True)
+            sorted_preds = predicates.most_common()
             
             for pred, count in sorted_preds:
                 
@@ -314,18 +458,41 @@ class BUPTResearchRDF:
         
         print(f"\n报告已生成: {report_path}")
 
-def create_unified_store(rdf_graph, store_dir="unified_store"):
+def process_chunk(rows):
+    """Convert a list of (idx, row) pairs in a worker process"""
+    converter = BUPTResearchRDF()
+    for idx, row in rows:
+        converter.process_paper(idx, row)
+    return converter.pending_triples, converter.paper_count, converter.triple_count
+
+def create_unified_store(rdf_graph, store_dir="unified_store", turtle_path=None):
     print("\n创建统一的三元组存储...")
     
     os.makedirs(store_dir, exist_ok=True)
     
     
     complete_store = f"{store_dir}/complete_store.ttl"
-    rdf_graph.serialize(destination=complete_store, format='turtle')
+    if turtle_path:
+        # The graph was already written as Turtle by convert(); copying the
+        # file avoids running the (slow) Turtle serializer a second time
+        shutil.copyfile(turtle_path, complete_store)
+    else:
+        rdf_graph.serialize(destination=complete_store, format='turtle')
     print(f"✓ 完整统一存储: {complete_store}")
     
+    # N-Triples copy for the web app: one triple per line parses faster than Turtle.
+    # Lines are sorted so regenerating the store produces the same file. The
+    # first line records the TTL's md5, so the app only uses this copy while
+    # it matches the TTL (file times aren't reliable after a git checkout).
+    complete_nt = f"{store_dir}/complete_store.nt"
+    lines = rdf_graph.serialize(format='nt', encoding='utf-8').splitlines(keepends=True)
+    with open(complete_nt, 'wb') as f:
+        f.write(f"# source-md5: {file_md5(complete_store).hexdigest()}\n".encode('ascii'))
+        f.writelines(sorted(line for line in lines if line.strip()))
+    print(f"✓ N-Triples存储: {complete_nt}")
+    
     
-    triples = len(list(rdf_graph))
+    triples = len(rdf_graph)
     print(f"✓ 总三元组数: {triples}")
     
     return store_dir
@@ -349,7 +516,8 @@ def main():
     
     if rdf_graph:
         
-        store_dir = create_unified_store(rdf_graph, store_dir="unified_store")
+        store_dir = create_unified_store(rdf_graph, store_dir="unified_store",
+                                         turtle_path="output/complete_bupt_research.ttl")
         
         print("\n" + "=" * 60)
         print("转换完成！")
@@ -358,6 +526,7 @@ def main():
         print(f"  output/complete_bupt_research.ttl - 完整RDF文件")
         print(f"  output/conversion_report.txt - 转换报告")
         print(f"  {store_dir}/complete_store.ttl - 统一存储")
+        print(f"  {store_dir}/complete_store.nt - 统一存储 (N-Triples)")
         
         print(f"\n关键统计:")
         print(f"  处理论文数: {converter.paper_count}")
@@ -1,21 +1,35 @@
 # app.py
 from flask import Flask, render_template, request, Response, jsonify
-from rdflib import URIRef
+from markupsafe import escape
 from config import Config
 from models import RDFDataModel
-from queries import SPARQLQueries
+from queries import SPARQLQueries, PaperRow
+from collections import OrderedDict
+from functools import lru_cache
+from threading import Lock
+import gzip
+import hashlib
 import os
+import re
+
+# Optional: gzip/br compression of responses (pip install flask-compress)
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
 
 # ==================== 1. Create Flask Application ====================
 app = Flask(__name__)
 app.config.from_object(Config)
 app.config['JSON_AS_ASCII'] = False  # Support Chinese characters in JSON
+if Compress is not None:
+    Compress(app)  # JSON/HTML results shrink several times on the wire
 
 # ==================== 2. Load Data ====================
 print(f"Loading data from: {Config.TTL_PATH}")
 model = RDFDataModel(Config.TTL_PATH)
 model.load()
-queries = SPARQLQueries(model.graph)
+queries = SPARQLQueries(model.graph, model.search_index)
 stats = model.get_statistics()
 print(f"✅ Loaded: {stats['papers']} papers, {stats['authors']} authors")
 
@@ -42,14 +56,119 @@ def get_preferred_format():
         return 'html'         # Default to human-readable HTML
 
 def serialize_graph(graph, format_type):
-    """Convert RDF graph to specified format"""
+    """Convert RDF graph to specified format, as UTF-8 bytes ready to send"""
     if format_type == 'turtle':
-        return graph.serialize(format='turtle')
+        return graph.serialize(format='turtle', encoding='utf-8')
     elif format_type == 'json-ld':
-        return graph.serialize(format='json-ld')
+        return graph.serialize(format='json-ld', encoding='utf-8')
     return None
 
-# ==================== 4. Routes ====================
+# Namespace -> prefix for display. One regex match replaces a startswith()
+# per namespace; longest namespaces come first so the most specific wins.
+NAMESPACE_PREFIXES = {ns: prefix for prefix, ns in Config.NAMESPACES.items()}
+NAMESPACE_PATTERN = re.compile('|'.join(
+    re.escape(ns) for ns in sorted(NAMESPACE_PREFIXES, key=len, reverse=True)))
+
+def compact_uri(uri):
+    """Shorten a URI to prefix form (e.g. schema:name) when a namespace matches"""
+    match = NAMESPACE_PATTERN.match(uri)
+    if match is None:
+        return uri
+    return f"{NAMESPACE_PREFIXES[match.group(0)]}:{uri[match.end():]}"
+
+def rdf_response(document, format_type):
+    """
+    Response for a cached (bytes, gzipped bytes, ETag) RDF document
+    
+    Clients accepting gzip get the pre-compressed body, so it is not
+    compressed again per request. Clients that already have this version
+    get a 304 without the body.
+    """
+    data, data_gz, etag = document
+    # Quality check rather than membership, so "gzip;q=0" means no gzip
+    if request.accept_encodings['gzip'] > 0:
+        response = Response(data_gz)
+        response.headers['Content-Encoding'] = 'gzip'
+        etag += '-gz'  # Each encoding is a different representation
+    else:
+        response = Response(data)
+    response.mimetype = 'text/turtle' if format_type == 'turtle' else 'application/ld+json'
+    response.vary.add('Accept')
+    response.vary.add('Accept-Encoding')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = 3600
+    return response.make_conditional(request)
+
+def rdf_document(data):
+    """Serialized RDF bytes as (bytes, gzipped bytes, ETag) for rdf_response()"""
+    return data, gzip.compress(data, 6), hashlib.md5(data).hexdigest()
+
+# ==================== 4. Cached Lookups ====================
+# The graph is read-only once loaded, so results can be cached for the
+# lifetime of the process. Cached values are tuples so callers can't mutate them.
+
+@lru_cache(maxsize=1024)
+def search_results(keyword):
+    """Search results for a (lowercased) keyword as display rows"""
+    return tuple(PaperRow(
+        str(row.paper),
+        str(row.title),
+        str(row.authorName) if row.authorName else 'Unknown',
+        str(row.year) if row.year else 'Unknown'
+    ) for row in queries.search_papers(keyword))
+
+@lru_cache(maxsize=None)
+def graph_document(format_type):
+    """The whole graph serialized once per format (see rdf_document)"""
+    return rdf_document(serialize_graph(model.graph, format_type))
+
+@lru_cache(maxsize=4096)
+def resource_document(uri, format_type):
+    """One resource's triples serialized (see rdf_document)"""
+    return rdf_document(serialize_graph(model.get_resource_graph(uri), format_type))
+
+# User SPARQL results are kept in a small LRU cache of their own: unlike the
+# lookups above their size is unbounded, so only short queries with at most
+# SPARQL_CACHE_MAX_ROWS rows are kept (a whole-graph SELECT is not)
+SPARQL_CACHE_SIZE = 256
+SPARQL_CACHE_MAX_ROWS = 1000
+SPARQL_CACHE_MAX_QUERY_LENGTH = 4096
+sparql_cache = OrderedDict()
+sparql_cache_lock = Lock()
+
+def sparql_results(query):
+    """Variables and rows of a user SPARQL query (None, () if not a SELECT)"""
+    with sparql_cache_lock:
+        cached = sparql_cache.get(query)
+        if cached is not None:
+            sparql_cache.move_to_end(query)
+            return cached
+    
+    results = model.execute_query(query)
+    if not results.vars:
+        value = None, ()
+    else:
+        variables = tuple(results.vars)
+        value = variables, tuple(tuple(row[var] for var in variables) for row in results)
+    
+    if len(value[1]) <= SPARQL_CACHE_MAX_ROWS and len(query) <= SPARQL_CACHE_MAX_QUERY_LENGTH:
+        with sparql_cache_lock:
+            sparql_cache[query] = value
+            if len(sparql_cache) > SPARQL_CACHE_SIZE:
+                sparql_cache.popitem(last=False)
+    return value
+
+@lru_cache(maxsize=1024)
+def resource_properties(uri):
+    """Properties of a resource for the HTML page, predicates in prefix form"""
+    properties = []
+    for p, o in model.get_properties(uri):
+        # Simplify predicate display (convert long URIs to prefix form)
+        properties.append({'predicate': compact_uri(str(p)), 'object': str(o)})
+    return tuple(properties)
+
+# ==================== 5. Routes ====================
 
 @app.route('/')
 def home():
@@ -58,8 +177,7 @@ def home():
     
     # If not HTML, return RDF data
     if fmt != 'html':
-        return Response(serialize_graph(model.graph, fmt), 
-                       mimetype='text/turtle' if fmt=='turtle' else 'application/ld+json')
+        return rdf_response(graph_document(fmt), fmt)
     
     # Return HTML page
     return render_template('home.html', stats=stats)
@@ -84,25 +202,13 @@ def get_resource(entity_type, entity_id):
     
     # If RDF format requested, return serialized data
     if fmt != 'html':
-        result_graph = model.get_resource_graph(uri)
-        return Response(serialize_graph(result_graph, fmt),
-                       mimetype='text/turtle' if fmt=='turtle' else 'application/ld+json')
+        return rdf_response(resource_document(uri, fmt), fmt)
     
     # For HTML, organize properties for display
-    properties = []
-    for s, p, o in model.graph.triples((URIRef(uri), None, None)):
-        # Simplify predicate display (convert long URIs to prefix form)
-        pred = str(p)
-        for prefix, ns in Config.NAMESPACES.items():
-            if pred.startswith(ns):
-                pred = f"{prefix}:{pred[len(ns):]}"
-                break
-        properties.append({'predicate': pred, 'object': str(o)})
-    
     return render_template('resource.html', 
                          title=f"{entity_type}: {entity_id}",
                          uri=uri, 
-                         properties=properties)
+                         properties=resource_properties(uri))
 
 @app.route('/papers')
 def papers_list():
@@ -111,9 +217,12 @@ def papers_list():
     page = int(request.args.get('page', 1))
     per_page = Config.ITEMS_PER_PAGE
     offset = (page - 1) * per_page
+    after = request.args.get('after')  # Optional cursor (see get_papers_list)
     
     # Query papers for this page
-    papers = queries.get_papers_list(limit=per_page, offset=offset)
+    papers = queries.get_papers_list(limit=per_page, offset=offset, after=after)
+    # The cursor for Next: the page continues after this page's last item
+    next_after = papers[-1].uri if papers else None
     
     # Calculate total pages
     total = stats['papers']
@@ -122,7 +231,8 @@ def papers_list():
     return render_template('papers.html', 
                          papers=papers,
                          page=page,
-                         total_pages=total_pages)
+                         total_pages=total_pages,
+                         next_after=next_after)
 
 @app.route('/authors')
 def authors_list():
@@ -130,8 +240,11 @@ def authors_list():
     page = int(request.args.get('page', 1))
     per_page = Config.ITEMS_PER_PAGE
     offset = (page - 1) * per_page
+    after = request.args.get('after')  # Optional cursor (see get_papers_list)
     
-    authors = queries.get_authors_list(limit=per_page, offset=offset)
+    authors = queries.get_authors_list(limit=per_page, offset=offset, after=after)
+    # The cursor for Next: the page continues after this page's last item
+    next_after = authors[-1].uri if authors else None
     
     total = stats['authors']
     total_pages = (total + per_page - 1) // per_page
@@ -139,7 +252,8 @@ def authors_list():
     return render_template('authors.html', 
                          authors=authors,
                          page=page,
-                         total_pages=total_pages)
+                         total_pages=total_pages,
+                         next_after=next_after)
 
 @app.route('/organizations')
 def organizations_list():
@@ -147,8 +261,11 @@ def organizations_list():
     page = int(request.args.get('page', 1))
     per_page = Config.ITEMS_PER_PAGE
     offset = (page - 1) * per_page
+    after = request.args.get('after')  # Optional cursor (see get_papers_list)
     
-    orgs = queries.get_organizations_list(limit=per_page, offset=offset)
+    orgs = queries.get_organizations_list(limit=per_page, offset=offset, after=after)
+    # The cursor for Next: the page continues after this page's last item
+    next_after = orgs[-1].uri if orgs else None
     
     total = stats['organizations']
     total_pages = (total + per_page - 1) // per_page
@@ -156,7 +273,8 @@ def organizations_list():
     return render_template('organizations.html', 
                          organizations=orgs,
                          page=page,
-                         total_pages=total_pages)
+                         total_pages=total_pages,
+                         next_after=next_after)
 
 @app.route('/search')
 def search():
@@ -168,19 +286,12 @@ def search():
     if not keyword:
         return render_template('search.html', query='', results=[], total=0)
     
-    # Execute search
-    results = []
-    for row in queries.search_papers(keyword):
-        results.append({
-            'uri': str(row.paper),
-            'title': str(row.title),
-            'author': str(row.authorName) if row.authorName else 'Unknown',
-            'year': str(row.year) if row.year else 'Unknown'
-        })
+    # Execute search (search is case-insensitive, so normalize the cache key)
+    results = search_results(keyword.lower())
     
     # If JSON format requested, return JSON directly
     if fmt == 'json-ld':
-        return jsonify(results)
+        return jsonify([row._asdict() for row in results])
     
     # Otherwise return HTML page
     return render_template('search.html', 
@@ -218,40 +329,38 @@ def sparql_endpoint():
         </html>
         '''
     
-    # Execute query
+    # Execute query (repeated queries come from the cache)
     try:
-        results = model.execute_query(query)
-        
-        # Display results as HTML table
-        html = '<html><head><title>SPARQL Results</title>'
-        html += '<style>table { border-collapse: collapse; } td, th { border: 1px solid #ddd; padding: 8px; }</style>'
-        html += '</head><body>'
-        html += '<h2>Query Results</h2>'
-        html += '<table><tr>'
-        
-        if results.vars:
-            for var in results.vars:
-                html += f'<th>{var}</th>'
-            html += '</tr>'
-            
-            for row in results:
-                html += '<tr>'
-                for var in results.vars:
-                    val = row[var]
-                    html += f'<td>{val}</td>'
-                html += '</tr>'
-            html += '</table>'
-        else:
-            html += '<p>No results</p>'
-        
-        html += '<p><a href="/sparql">New Query</a></p>'
-        html += '</body></html>'
-        return html
-        
+        variables, rows = sparql_results(query.strip())
     except Exception as e:
-        return f'<p>Error: {e}</p>', 400
+        return f'<p>Error: {escape(e)}</p>', 400
+    
+    # Display results as HTML table; values are escaped because literals in
+    # the data (or the query) may contain markup. The rows are already in
+    # memory, so the page is built as one body rather than streamed
+    # (flask-compress's streaming algorithms leave out gzip).
+    parts = ['<html><head><title>SPARQL Results</title>',
+             '<style>table { border-collapse: collapse; } td, th { border: 1px solid #ddd; padding: 8px; }</style>',
+             '</head><body>',
+             '<h2>Query Results</h2>',
+             '<table><tr>']
+    
+    if variables:
+        parts.append(''.join(f'<th>{escape(var)}</th>' for var in variables))
+        parts.append('</tr>')
+        
+        for row in rows:
+            parts.append('<tr>' + ''.join(f'<td>{escape(val)}</td>' for val in row) + '</tr>')
+        parts.append('</table>')
+    else:
+        parts.append('<p>No results</p>')
+    
+    parts.append('<p><a href="/sparql">New Query</a></p>')
+    parts.append('</body></html>')
+    
+    return Response(''.join(parts), mimetype='text/html')
 
-# ==================== 5. Start Server ====================
+# ==================== 6. Start Server ====================
 if __name__ == '__main__':
     print("\n" + "="*60)
     print("🚀 BUPT Linked Data System Starting...")
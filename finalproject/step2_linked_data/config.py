@@ -25,4 +25,13 @@ class Config:
     }
     
     # Pagination settings - items per page
-    ITEMS_PER_PAGE = 20
\ No newline at end of file
+    ITEMS_PER_PAGE = 20
+    
+    # Response compression (used when flask-compress is installed)
+    COMPRESS_MIN_SIZE = 512   # Don't bother compressing responses smaller than this (bytes)
+    COMPRESS_MIMETYPES = [    # flask-compress skips the RDF types unless listed
+        'text/html',
+        'application/json',
+        'text/turtle',
+        'application/ld+json',
+    ]
\ No newline at end of file
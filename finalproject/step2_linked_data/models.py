@@ -1,9 +1,144 @@
 # models.py
-from rdflib import Graph, URIRef
-from rdflib.namespace import RDF, FOAF
+from rdflib import Graph, URIRef, BNode, Literal, Variable
+from rdflib.namespace import RDF, FOAF, XSD
+from rdflib.plugins.sparql import prepareQuery
+from rdflib.plugins.sparql.algebra import traverse
+import hashlib
 import os
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from config import Config
 
+# Optional: Oxigraph (Rust) runs user SPARQL much faster than rdflib's engine.
+# Without it, execute_query() simply uses the rdflib graph.
+try:
+    import pyoxigraph
+except ImportError:
+    pyoxigraph = None
+
+# Prefixes /sparql queries may use without declaring them (the ontology
+# namespace written by step1.py is not in Config.NAMESPACES)
+DEFAULT_PREFIXES = {**Config.NAMESPACES, 'bupt-onto': 'http://bupt.edu.cn/ontology/'}
+
+XSD_STRING = str(XSD.string)
+
+
+def _to_rdflib(term):
+    """Convert a pyoxigraph term to the equivalent rdflib term"""
+    if term is None:
+        return None
+    if isinstance(term, pyoxigraph.NamedNode):
+        return URIRef(term.value)
+    if isinstance(term, pyoxigraph.BlankNode):
+        return BNode(term.value)
+    if term.language:
+        return Literal(term.value, lang=term.language)
+    datatype = term.datatype.value
+    if datatype == XSD_STRING:
+        # Oxigraph gives plain literals the datatype xsd:string; rdflib keeps
+        # them untyped, and the two don't compare equal
+        return Literal(term.value)
+    return Literal(term.value, datatype=URIRef(datatype))
+
+
+def _nt_matches_ttl(nt_path, ttl_path):
+    """
+    Whether an N-Triples copy was generated from this TTL file
+    
+    step1.py starts the .nt with a "# source-md5: <md5 of the TTL>" comment.
+    Content is compared rather than modification times, which git does not
+    preserve (a fresh checkout can make the .nt look older than the TTL).
+    """
+    with open(nt_path, 'rb') as f:
+        first_line = f.readline().strip()
+    prefix = b'# source-md5: '
+    if not first_line.startswith(prefix):
+        return False
+    digest = hashlib.md5()
+    with open(ttl_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return first_line[len(prefix):].decode('ascii') == digest.hexdigest()
+
+
+def _drop_repeated_patterns(node):
+    """Remove repeated triple patterns from a BGP node of a query algebra"""
+    if getattr(node, 'name', None) == 'BGP':
+        # A BGP is a set of patterns: a repeat only adds a redundant join
+        node['triples'] = list(dict.fromkeys(node['triples']))
+
+
+def _oxigraph_format(source_format):
+    """pyoxigraph format for an rdflib format name ("nt" or "turtle")"""
+    if source_format == "nt":
+        return pyoxigraph.RdfFormat.N_TRIPLES
+    return pyoxigraph.RdfFormat.TURTLE
+
+
+class OxigraphResult:
+    """
+    Oxigraph query result with the same shape as an rdflib SPARQL result
+    
+    Exposes `vars` (None for ASK/CONSTRUCT, like rdflib) and yields rows
+    that can be indexed by variable, so callers don't need to know which
+    engine ran the query.
+    """
+    
+    def __init__(self, result):
+        self._result = result
+        if isinstance(result, pyoxigraph.QuerySolutions):
+            self.vars = [Variable(v.value) for v in result.variables]
+        else:
+            self.vars = None
+    
+    def __iter__(self):
+        if self.vars is None:
+            return
+        # Solutions are indexed by column position, so no name is converted
+        # and looked up for every cell
+        columns = list(enumerate(self.vars))
+        for solution in self._result:
+            yield {var: _to_rdflib(solution[i]) for i, var in columns}
+
+class SearchIndex:
+    """
+    Keyword search index over lowercased paper titles and author names
+    
+    Every one- and two-character piece of every label is mapped to the
+    labels containing it. A keyword's candidates are the intersection of
+    the sets for its two-character pieces, and only those labels are
+    checked with a substring test. This works for Chinese titles, which
+    have no spaces to split words on.
+    """
+    
+    def __init__(self, entries):
+        """
+        Args:
+            entries (list): (lowercased label, paper URI) pairs
+        """
+        self.entries = entries
+        self.grams = defaultdict(set)
+        for position, (label, paper) in enumerate(entries):
+            for i in range(len(label)):
+                self.grams[label[i]].add(position)
+                self.grams[label[i:i + 2]].add(position)
+    
+    def papers_matching(self, keyword):
+        """
+        Papers with a label containing the (lowercased) keyword
+        
+        Returns:
+            set: Paper URIs
+        """
+        if len(keyword) <= 1:
+            candidates = self.grams.get(keyword, ()) if keyword else range(len(self.entries))
+        else:
+            pieces = sorted((self.grams.get(keyword[i:i + 2], set())
+                             for i in range(len(keyword) - 1)), key=len)
+            candidates = set.intersection(*pieces)
+        return {self.entries[position][1] for position in candidates
+                if keyword in self.entries[position][0]}
+
 class RDFDataModel:
     """
     RDF Data Model - responsible for loading and basic querying of RDF data
@@ -18,9 +153,19 @@ class RDFDataModel:
         """
         self.ttl_path = ttl_path
         self.graph = None
+        self.store = None  # pyoxigraph.Store, when pyoxigraph is installed
         # Fix: Define schema as the full URI string, not URIRef object
         self.schema = "http://schema.org/"
         self.loaded = False
+        # Keyword search index (SearchIndex), built in load()
+        self.search_index = None
+        # Entity counts, computed once in load() (the graph never changes)
+        self.statistics = None
+        # (predicate, object) pairs of every subject, built once in load(), for
+        # resource pages and O(1) resource_exists() checks
+        self.subject_properties = {}
+        # Prefix -> namespace for raw SPARQL queries, set in load()
+        self.query_prefixes = {}
         
     def load(self):
         """
@@ -39,18 +184,122 @@ class RDFDataModel:
         if not os.path.exists(self.ttl_path):
             raise FileNotFoundError(f"TTL file not found: {self.ttl_path}")
         
+        # Prefer the N-Triples copy written next to the TTL by step1.py,
+        # which parses faster than Turtle - but only while it was made from
+        # this exact TTL (see _nt_matches_ttl), so it never serves stale data
+        source_path, source_format = self.ttl_path, "turtle"
+        nt_path = os.path.splitext(self.ttl_path)[0] + ".nt"
+        if os.path.exists(nt_path) and _nt_matches_ttl(nt_path, self.ttl_path):
+            source_path, source_format = nt_path, "nt"
+        
         # Create new graph and load data
         self.graph = Graph()
         
         try:
-            self.graph.parse(self.ttl_path, format="turtle")
-            self.loaded = True
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                # Oxigraph's bulk load runs in Rust without the GIL, so it
+                # overlaps with the graph parse below instead of following it
+                store_loading = None
+                if pyoxigraph is not None:
+                    store_loading = executor.submit(self.load_store, source_path, source_format)
+                    self.parse_with_oxigraph(source_path, source_format)
+                else:
+                    self.graph.parse(source_path, format=source_format)
+                self.loaded = True
+                # N-Triples has no @prefix lines, so bind the data's namespaces
+                # here; replace=True overrides rdflib's built-in bindings
+                # (which map schema: to https://schema.org/)
+                for prefix, namespace in DEFAULT_PREFIXES.items():
+                    self.graph.bind(prefix, namespace, override=True, replace=True)
+                self.query_prefixes = {prefix: str(ns) for prefix, ns in self.graph.namespaces()}
+                self.search_index = self.build_search_index()
+                self.statistics = self.compute_statistics()
+                self.subject_properties = self.build_subject_properties()
+                if store_loading is not None:
+                    self.store = store_loading.result()
             print(f"✅ Successfully loaded! Total triples: {len(self.graph)}")
             return self.graph
         except Exception as e:
             print(f"❌ Failed to load: {e}")
             raise
     
+    def load_store(self, source_path, source_format):
+        """
+        Bulk load the data file into a new Oxigraph store
+        
+        Args:
+            source_path (str): Path to the N-Triples or Turtle file
+            source_format (str): "nt" or "turtle"
+        
+        Returns:
+            pyoxigraph.Store: The loaded store
+        """
+        store = pyoxigraph.Store()
+        store.bulk_load(path=source_path, format=_oxigraph_format(source_format))
+        return store
+    
+    def parse_with_oxigraph(self, source_path, source_format):
+        """
+        Fill self.graph using Oxigraph's (Rust) parser instead of rdflib's
+        
+        Parsing is nearly free in Rust; the cost is converting terms to
+        rdflib, so each distinct term is converted once and then shared by
+        all the triples that use it (about 9.4k terms for 32k triples).
+        
+        Args:
+            source_path (str): Path to the N-Triples or Turtle file
+            source_format (str): "nt" or "turtle"
+        """
+        terms = {}
+        
+        def convert(term):
+            converted = terms.get(term)
+            if converted is None:
+                converted = terms[term] = _to_rdflib(term)
+            return converted
+        
+        parser = pyoxigraph.parse(path=source_path, format=_oxigraph_format(source_format))
+        self.graph.addN((convert(quad.subject), convert(quad.predicate),
+                         convert(quad.object), self.graph) for quad in parser)
+        # Keep the file's prefixes, as rdflib's Turtle parser would
+        for prefix, namespace in parser.prefixes.items():
+            self.graph.bind(prefix, namespace)
+    
+    def build_search_index(self):
+        """
+        Build the keyword search index (graph is read-only, so built once)
+        
+        Each paper contributes its title, and each author name is listed
+        once for every paper of that author, so a keyword search becomes a
+        lookup over plain Python strings instead of a SPARQL FILTER.
+        
+        Returns:
+            SearchIndex: Index over (lowercased label, paper URI) pairs
+        """
+        scholarly_article = URIRef(self.schema + "ScholarlyArticle")
+        name = URIRef(self.schema + "name")
+        author = URIRef(self.schema + "author")
+        
+        index = []
+        for paper in self.graph.subjects(RDF.type, scholarly_article):
+            for title in self.graph.objects(paper, name):
+                index.append((str(title).lower(), paper))
+            for author_uri in self.graph.objects(paper, author):
+                for author_name in self.graph.objects(author_uri, FOAF.name):
+                    index.append((str(author_name).lower(), paper))
+        return SearchIndex(index)
+    
+    def build_subject_properties(self):
+        """
+        Group the triples of every subject (in the graph's own order, so
+        pages list properties exactly as a triples() lookup would)
+        
+        Returns:
+            dict: subject URI -> list of (predicate, object) pairs
+        """
+        return {s: list(self.graph.predicate_objects(s))
+                for s in self.graph.subjects(unique=True)}
+    
     def get_statistics(self):
         """
         Get statistics about the data
@@ -61,6 +310,15 @@ class RDFDataModel:
         if not self.loaded:
             raise Exception("Data not loaded yet. Call load() first.")
         
+        return dict(self.statistics)
+    
+    def compute_statistics(self):
+        """
+        Count entities by type (called once by load())
+        
+        Returns:
+            dict: Statistics including paper count, author count, etc.
+        """
         # Fix: Use URIRef to create proper URI objects for querying
         scholarly_article = URIRef(self.schema + "ScholarlyArticle")
         person = URIRef("http://xmlns.com/foaf/0.1/Person")
@@ -68,19 +326,15 @@ class RDFDataModel:
         periodical = URIRef(self.schema + "Periodical")
         defined_term = URIRef(self.schema + "DefinedTerm")
         
-        # Count different entity types
-        papers = list(self.graph.subjects(RDF.type, scholarly_article))
-        authors = list(self.graph.subjects(RDF.type, person))
-        orgs = list(self.graph.subjects(RDF.type, organization))
-        journals = list(self.graph.subjects(RDF.type, periodical))
-        keywords = list(self.graph.subjects(RDF.type, defined_term))
+        # Count every entity type in one pass over the rdf:type triples
+        type_counts = Counter(self.graph.objects(None, RDF.type))
         
         stats = {
-            'papers': len(papers),
-            'authors': len(authors),
-            'organizations': len(orgs),
-            'journals': len(journals),
-            'keywords': len(keywords),
+            'papers': type_counts[scholarly_article],
+            'authors': type_counts[person],
+            'organizations': type_counts[organization],
+            'journals': type_counts[periodical],
+            'keywords': type_counts[defined_term],
             'triples': len(self.graph)
         }
         
@@ -99,7 +353,7 @@ class RDFDataModel:
         if not self.loaded:
             raise Exception("Data not loaded yet. Call load() first.")
         
-        return (URIRef(uri), None, None) in self.graph
+        return URIRef(uri) in self.subject_properties
     
     def get_resource_graph(self, uri):
         """
@@ -117,11 +371,26 @@ class RDFDataModel:
         result = Graph()
         uri_ref = URIRef(uri)
         
-        for s, p, o in self.graph.triples((uri_ref, None, None)):
-            result.add((s, p, o))
+        for p, o in self.get_properties(uri):
+            result.add((uri_ref, p, o))
         
         return result
     
+    def get_properties(self, uri):
+        """
+        Get the (predicate, object) pairs of a resource
+        
+        Args:
+            uri (str): Resource URI
+            
+        Returns:
+            list: (predicate, object) pairs, empty if the resource doesn't exist
+        """
+        if not self.loaded:
+            raise Exception("Data not loaded yet. Call load() first.")
+        
+        return self.subject_properties.get(URIRef(uri), [])
+    
     def get_all_papers(self):
         """
         Get all paper URIs
@@ -230,16 +499,26 @@ class RDFDataModel:
         """
         Execute a raw SPARQL query
         
+        Uses the Oxigraph store when available, otherwise the rdflib graph.
+        Both engines get the same prefixes (query_prefixes), so queries may
+        use schema:, bupt-onto: etc. without PREFIX lines. For rdflib,
+        repeated triple patterns are dropped before evaluation (Oxigraph's
+        optimizer already does this).
+        
         Args:
             query_string (str): SPARQL query string
             
         Returns:
-            QueryResult: SPARQL query results
+            QueryResult or OxigraphResult: SPARQL query results
         """
         if not self.loaded:
             raise Exception("Data not loaded yet. Call load() first.")
         
-        return self.graph.query(query_string)
+        if self.store is not None:
+            return OxigraphResult(self.store.query(query_string, prefixes=self.query_prefixes))
+        query = prepareQuery(query_string, initNs=self.query_prefixes)
+        traverse(query.algebra, visitPost=_drop_repeated_patterns)
+        return self.graph.query(query)
 
 
 # Test code - run this file directly to test
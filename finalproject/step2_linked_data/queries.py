@@ -1,4 +1,98 @@
 # queries.py
+from bisect import bisect_right
+from collections import namedtuple
+from rdflib import Literal, URIRef, Namespace
+from rdflib.namespace import RDF, FOAF, XSD
+from rdflib.plugins.sparql import prepareQuery
+
+# Prepared queries - parsed and compiled once at import, reused on every request.
+# Variables such as ?kw are bound per call via initBindings instead of being
+# pasted into the query text, so user input can never change the query itself.
+SEARCH_PAPERS_QUERY = prepareQuery("""
+    PREFIX schema: <http://schema.org/>
+    PREFIX foaf: <http://xmlns.com/foaf/0.1/>
+    PREFIX bupt-onto: <http://bupt.edu.cn/ontology/>
+    
+    SELECT ?paper ?title ?authorName ?year WHERE {
+        {
+            # Match and limit first, so the year is only looked up for
+            # the (at most 50) rows that are returned. Title and author
+            # matches are separate branches, each filtered before its joins.
+            SELECT DISTINCT ?paper ?title ?authorName WHERE {
+                {
+                    {
+                        ?paper a schema:ScholarlyArticle .
+                        ?paper bupt-onto:nameLower ?titleLower .
+                        FILTER(CONTAINS(?titleLower, ?kw))
+                    }
+                    ?paper schema:name ?title .
+                    OPTIONAL {
+                        ?paper schema:author ?author .
+                        ?author foaf:name ?authorName .
+                    }
+                }
+                UNION
+                {
+                    {
+                        ?paper a schema:ScholarlyArticle .
+                        ?paper schema:author ?author .
+                        ?author bupt-onto:nameLower ?authorLower .
+                        FILTER(CONTAINS(?authorLower, ?kw))
+                    }
+                    ?author foaf:name ?authorName .
+                    ?paper schema:name ?title .
+                }
+            }
+            LIMIT 50
+        }
+        OPTIONAL { ?paper schema:datePublished ?year }
+    }
+""")
+
+PAPERS_BY_AUTHOR_QUERY = prepareQuery("""
+    PREFIX schema: <http://schema.org/>
+    PREFIX dcterms: <http://purl.org/dc/terms/>
+    
+    SELECT ?paper ?title ?year WHERE {
+        ?paper dcterms:creator ?author .
+        ?paper schema:name ?title .
+        OPTIONAL { ?paper schema:datePublished ?year }
+    }
+""")
+
+COAUTHORS_QUERY = prepareQuery("""
+    PREFIX schema: <http://schema.org/>
+    PREFIX dcterms: <http://purl.org/dc/terms/>
+    PREFIX foaf: <http://xmlns.com/foaf/0.1/>
+    
+    SELECT DISTINCT ?coauthor ?coauthorName WHERE {
+        ?paper dcterms:creator ?author .
+        ?paper dcterms:creator ?coauthor .
+        ?coauthor foaf:name ?coauthorName .
+        FILTER(?coauthor != ?author)
+    }
+""")
+
+PAPERS_BY_YEAR_QUERY = prepareQuery("""
+    PREFIX schema: <http://schema.org/>
+    
+    SELECT ?paper ?title WHERE {
+        ?paper a schema:ScholarlyArticle .
+        ?paper schema:name ?title .
+        ?paper schema:datePublished ?year .
+    }
+""")
+
+SCHEMA = Namespace("http://schema.org/")
+
+# Same fields as a SEARCH_PAPERS_QUERY result row, for index-based search
+SearchRow = namedtuple('SearchRow', ['paper', 'title', 'authorName', 'year'])
+MemberRow = namedtuple('MemberRow', ['author', 'name'])
+# Display rows for the list and search pages (attribute access, like dicts in Jinja)
+PaperRow = namedtuple('PaperRow', ['uri', 'title', 'author', 'year'])
+NamedRow = namedtuple('NamedRow', ['uri', 'name'])
+
+
 class SPARQLQueries:
     """
     SPARQL Queries - Centralized management of all query statements
@@ -6,14 +100,21 @@ class SPARQLQueries:
     Data source: Graph loaded into memory by models.py
     """
     
-    def __init__(self, graph):
+    def __init__(self, graph, search_index=None):
         """
         Initialize query module
         
         Args:
             graph: RDF graph object from models.py (data in memory)
+            search_index: Optional SearchIndex from
+                RDFDataModel.build_search_index(); without it search uses SPARQL
         """
         self.graph = graph
+        self.search_index = search_index
+        # Subjects of each type sorted by URI, for keyset pagination (built on first use)
+        self._sorted_subjects = {}
+        # Authors / organizations as ready-made list entries (built on first use)
+        self._named_lists = {}
     
     def search_papers(self, keyword):
         """
@@ -25,118 +126,148 @@ class SPARQLQueries:
         
         SPARQL explanation:
         - CONTAINS: Fuzzy matching, returns if contains keyword
+        - nameLower: Lowercased copy of each name written by step1.py, so the
+          match is case-insensitive without LCASE on every row
+        - UNION: Title matches and author matches are found separately, so
+          each FILTER runs before the joins instead of on every combination
         - OPTIONAL: Some papers may not have author info, still display
         - LIMIT 50: Return at most 50 results to avoid too much data
+        
+        When a search index is available the same rows are produced from it
+        without running SPARQL; the query above is the fallback.
+        """
+        keyword = keyword.lower()
+        if self.search_index is None:
+            return self.graph.query(SEARCH_PAPERS_QUERY,
+                                    initBindings={'kw': Literal(keyword)})
+        return self._search_with_index(keyword, limit=50)
+    
+    def _search_with_index(self, keyword, limit):
         """
-        query = f"""
-        PREFIX schema: <http://schema.org/>
-        PREFIX foaf: <http://xmlns.com/foaf/0.1/>
+        Keyword search answered from the in-memory index
         
-        SELECT DISTINCT ?paper ?title ?authorName ?year WHERE {{
-            ?paper a schema:ScholarlyArticle .
-            ?paper schema:name ?title .
-            OPTIONAL {{
-                ?paper schema:author ?author .
-                ?author foaf:name ?authorName .
-            }}
-            OPTIONAL {{ ?paper schema:datePublished ?year }}
-            FILTER(CONTAINS(?title, "{keyword}") || 
-                   CONTAINS(?authorName, "{keyword}"))
-        }}
-        LIMIT 50
+        Matching papers are looked up in the index, then
+        one row per (paper, author) is built with direct graph lookups,
+        keeping the rows where the title or that author's name matches.
         """
-        return self.graph.query(query)
+        papers = sorted(self.search_index.papers_matching(keyword))
+        
+        name = URIRef("http://schema.org/name")
+        author = URIRef("http://schema.org/author")
+        date_published = URIRef("http://schema.org/datePublished")
+        
+        rows = []
+        for paper in papers:
+            title = self.graph.value(paper, name)
+            year = self.graph.value(paper, date_published)
+            title_matches = keyword in str(title).lower()
+            author_names = [n for a in self.graph.objects(paper, author)
+                            for n in self.graph.objects(a, FOAF.name)]
+            if not author_names and title_matches:
+                rows.append(SearchRow(paper, title, None, year))
+            for author_name in dict.fromkeys(author_names):
+                if title_matches or keyword in str(author_name).lower():
+                    rows.append(SearchRow(paper, title, author_name, year))
+            if len(rows) >= limit:
+                break
+        return rows[:limit]
     
-    def get_papers_list(self, limit=20, offset=0):
+    def get_papers_list(self, limit=20, offset=0, after=None):
         """
         Get paginated list of papers
         
         Purpose: Used by papers list page
-        Input: limit=items per page, offset=number to skip (for pagination)
-        Output: List of papers (URI, title, author, year)
+        Input: limit=items per page, offset=number to skip (for pagination),
+               after=URI of the last paper on the previous page (optional)
+        Output: List of papers (URI, title, authors, year), one per paper
         
         Pagination principle:
         - Page 1: limit=20, offset=0  (items 1-20)
         - Page 2: limit=20, offset=20 (items 21-40)
         - Page 3: limit=20, offset=40 (items 41-60)
-        """
-        query = """
-        PREFIX schema: <http://schema.org/>
-        PREFIX foaf: <http://xmlns.com/foaf/0.1/>
         
-        SELECT ?paper ?title ?authorName ?year WHERE {
-            ?paper a schema:ScholarlyArticle .
-            ?paper schema:name ?title .
-            OPTIONAL {
-                ?paper schema:author ?author .
-                ?author foaf:name ?authorName .
-            }
-            OPTIONAL { ?paper schema:datePublished ?year }
-        }
+        Papers are in URI order. The page's papers are picked first (see
+        _page_subjects) and only their details are looked up, so the work
+        is bounded by the page size. With `after`, offset is ignored and the
+        page starts after that paper, so deep pages cost the same as the
+        first one.
         """
-        
-        # Execute query and format results
         results = []
-        for row in self.graph.query(query):
-            results.append({
-                'uri': str(row.paper),           # Paper URI for linking
-                'title': str(row.title),          # Paper title
-                'author': str(row.authorName) if row.authorName else 'Unknown',  # Author (may be multiple, take first)
-                'year': str(row.year) if row.year else 'Unknown'  # Publication year
-            })
+        for paper in self._page_subjects(SCHEMA.ScholarlyArticle, limit, offset, after):
+            title = self.graph.value(paper, SCHEMA.name)
+            year = self.graph.value(paper, SCHEMA.datePublished)
+            # Several authors are shown in one row instead of one row each
+            author_names = dict.fromkeys(str(n) for a in self.graph.objects(paper, SCHEMA.author)
+                                         for n in self.graph.objects(a, FOAF.name))
+            results.append(PaperRow(
+                str(paper),                                # Paper URI for linking
+                str(title),                                # Paper title
+                ', '.join(author_names) or 'Unknown',      # All authors
+                str(year) if year else 'Unknown'           # Publication year
+            ))
         
-        # Manual pagination (RDFlib's SPARQL doesn't support LIMIT and OFFSET well)
-        return results[offset:offset+limit]
+        return results
     
-    def get_authors_list(self, limit=20, offset=0):
+    def get_authors_list(self, limit=20, offset=0, after=None):
         """
         Get paginated list of authors
         
         Purpose: Used by authors list page
-        Output: List of authors (URI, name)
-        """
-        query = """
-        PREFIX foaf: <http://xmlns.com/foaf/0.1/>
+        Output: List of authors (URI, name), sorted by name
         
-        SELECT ?author ?name WHERE {
-            ?author a foaf:Person .
-            ?author foaf:name ?name .
-        }
+        `after` works as in get_papers_list (see _page_named).
         """
-        
-        results = []
-        for row in self.graph.query(query):
-            results.append({
-                'uri': str(row.author),  # Author URI
-                'name': str(row.name)     # Author name
-            })
-        
-        return results[offset:offset+limit]
+        return self._page_named(FOAF.Person, FOAF.name, limit, offset, after)
     
-    def get_organizations_list(self, limit=20, offset=0):
+    def get_organizations_list(self, limit=20, offset=0, after=None):
         """
         Get paginated list of organizations
         
         Purpose: Used by organizations list page
-        Output: List of organizations (URI, name)
+        Output: List of organizations (URI, name), sorted by name
+        
+        `after` works as in get_papers_list (see _page_named).
+        """
+        return self._page_named(SCHEMA.Organization, SCHEMA.name, limit, offset, after)
+    
+    def _page_named(self, type_uri, name_predicate, limit, offset=0, after=None):
         """
-        query = """
-        PREFIX schema: <http://schema.org/>
+        One page of the (URI, name) entries of a type, sorted by name
         
-        SELECT ?org ?name WHERE {
-            ?org a schema:Organization .
-            ?org schema:name ?name .
-        }
+        The whole list never changes, so it is built once and every page is
+        a plain list slice - no query per request. `after` is the URI of the
+        last entry of the previous page (an unknown one starts from the top).
         """
+        if type_uri not in self._named_lists:
+            entries = sorted((NamedRow(str(s), str(name))
+                              for s in self.graph.subjects(RDF.type, type_uri)
+                              for name in self.graph.objects(s, name_predicate)),
+                             key=lambda entry: (entry.name, entry.uri))
+            positions = {entry.uri: i for i, entry in enumerate(entries)}
+            self._named_lists[type_uri] = (entries, positions)
+        entries, positions = self._named_lists[type_uri]
         
-        results = []
-        for row in self.graph.query(query):
-            results.append({
-                'uri': str(row.org),   # Organization URI
-                'name': str(row.name)   # Organization name
-            })
+        if after is not None:
+            start = positions.get(after, -1) + 1
+        else:
+            start = max(offset, 0)
+        return entries[start:start + limit]
+    
+    def _page_subjects(self, type_uri, limit, offset=0, after=None):
+        """
+        One page of the subjects of a type, in URI order
         
-        return results[offset:offset+limit]
+        The subjects are sorted by URI once (the graph is read-only). With
+        `after` (keyset pagination) the page is found with a binary search
+        instead of skipping `offset` items; an unknown `after` simply starts
+        at the next URI after it.
+        """
+        subjects = self._sorted_subjects.get(type_uri)
+        if subjects is None:
+            subjects = sorted(self.graph.subjects(RDF.type, type_uri))
+            self._sorted_subjects[type_uri] = subjects
+        start = bisect_right(subjects, URIRef(after)) if after is not None else max(offset, 0)
+        return subjects[start:start + limit]
     
     def get_papers_by_author(self, author_uri):
         """
@@ -146,17 +277,8 @@ class SPARQLQueries:
         Input: Author URI (e.g., http://bupt.edu.cn/research/author/1234)
         Output: All papers by this author
         """
-        query = f"""
-        PREFIX schema: <http://schema.org/>
-        PREFIX dcterms: <http://purl.org/dc/terms/>
-        
-        SELECT ?paper ?title ?year WHERE {{
-            ?paper dcterms:creator <{author_uri}> .
-            ?paper schema:name ?title .
-            OPTIONAL {{ ?paper schema:datePublished ?year }}
-        }}
-        """
-        return self.graph.query(query)
+        return self.graph.query(PAPERS_BY_AUTHOR_QUERY,
+                                initBindings={'author': URIRef(author_uri)})
     
     def get_organization_members(self, org_uri):
         """
@@ -165,17 +287,14 @@ class SPARQLQueries:
         Purpose: Used by organization detail page
         Input: Organization URI
         Output: All authors in this organization
-        """
-        query = f"""
-        PREFIX schema: <http://schema.org/>
-        PREFIX foaf: <http://xmlns.com/foaf/0.1/>
         
-        SELECT ?author ?name WHERE {{
-            <{org_uri}> schema:member ?author .
-            ?author foaf:name ?name .
-        }}
+        The subject is known, so this reads the graph's index directly
+        instead of going through the SPARQL engine.
         """
-        return self.graph.query(query)
+        member = URIRef("http://schema.org/member")
+        return [MemberRow(author, name)
+                for author in self.graph.objects(URIRef(org_uri), member)
+                for name in self.graph.objects(author, FOAF.name)]
     
     def get_coauthors(self, author_uri):
         """
@@ -185,19 +304,8 @@ class SPARQLQueries:
         Input: Author URI
         Output: Other authors who have collaborated with this author
         """
-        query = f"""
-        PREFIX schema: <http://schema.org/>
-        PREFIX dcterms: <http://purl.org/dc/terms/>
-        PREFIX foaf: <http://xmlns.com/foaf/0.1/>
-        
-        SELECT DISTINCT ?coauthor ?coauthorName WHERE {{
-            ?paper dcterms:creator <{author_uri}> .
-            ?paper dcterms:creator ?coauthor .
-            ?coauthor foaf:name ?coauthorName .
-            FILTER(?coauthor != <{author_uri}>)
-        }}
-        """
-        return self.graph.query(query)
+        return self.graph.query(COAUTHORS_QUERY,
+                                initBindings={'author': URIRef(author_uri)})
     
     def get_papers_by_year(self, year):
         """
@@ -207,16 +315,8 @@ class SPARQLQueries:
         Input: Year (e.g., 2025)
         Output: All papers from that year
         """
-        query = f"""
-        PREFIX schema: <http://schema.org/>
-        
-        SELECT ?paper ?title WHERE {{
-            ?paper a schema:ScholarlyArticle .
-            ?paper schema:name ?title .
-            ?paper schema:datePublished {year} .
-        }}
-        """
-        return self.graph.query(query)
+        return self.graph.query(PAPERS_BY_YEAR_QUERY,
+                                initBindings={'year': Literal(str(year), datatype=XSD.gYear)})
 
 
 # Test code - Run this file directly to test query functionality
@@ -231,7 +331,7 @@ if __name__ == '__main__':
     model.load()
     
     # 2. Create query object
-    queries = SPARQLQueries(model.graph)
+    queries = SPARQLQueries(model.graph, model.search_index)
     
     # 3. Test search function
     print("\n🔍 Searching for papers containing 'artificial intelligence':")
@@ -243,10 +343,10 @@ if __name__ == '__main__':
     print("\n📄 Papers list (first 5):")
     papers = queries.get_papers_list(limit=5, offset=0)
     for p in papers:
-        print(f"  - {p['title']} - {p['author']} ({p['year']})")
+        print(f"  - {p.title} - {p.author} ({p.year})")
     
     # 5. Test authors list
     print("\n👤 Authors list (first 5):")
     authors = queries.get_authors_list(limit=5, offset=0)
     for a in authors:
-        print(f"  - {a['name']}")
\ No newline at end of file
+        print(f"  - {a.name}")
\ No newline at end of file
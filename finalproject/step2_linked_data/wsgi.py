@@ -0,0 +1,16 @@
+# wsgi.py
+"""
+Production entry point - serve the app with a real WSGI server instead of
+`python app.py` (Flask's single-threaded development server)
+
+Linux / macOS (--preload loads the RDF data once, before the workers fork,
+so all workers share the same read-only graph in memory):
+    gunicorn -w 4 -k gthread --threads 8 --preload -b 0.0.0.0:8080 wsgi:application
+
+Windows:
+    waitress-serve --listen=0.0.0.0:8080 --threads=8 wsgi:application
+"""
+from app import app as application
+
+# Config.DEBUG is meant for development; never run a production server with it
+application.debug = False